@@ -3,7 +3,7 @@ from dataclasses import dataclass
 import arcade
 import random
 from systems.inventory import Inventory
-from world.map import TILE_SIZE
+from world.map import TILE_SIZE, HALF_TILE
 from abc import ABC
 
 # Player can propose tradeOffer to Trader actors
@@ -11,6 +11,9 @@ from abc import ABC
 
 @dataclass(eq=False)
 class Actor(ABC):
+    # Fixed attribute slots: no per-instance __dict__, faster lookups
+    __slots__ = ("name", "location", "inventory", "sprite")
+
     # Initialize player with name and location (left/bottommost cell)
     def __init__(self, name, texture_path, location = (0,0), inventory=Inventory(gold=1, food=1, water=1, max_items=1)):
         self.name = name
@@ -18,8 +21,11 @@ class Actor(ABC):
         self.inventory = inventory
 
         self.sprite = arcade.Sprite(texture_path, scale = 0.03)  # Load player sprite
-        self.sprite.center_x = location[0] * TILE_SIZE + TILE_SIZE // 2
-        self.sprite.center_y = location[1] * TILE_SIZE + TILE_SIZE // 2
+        # single position write instead of two center_x/center_y setters
+        self.sprite.position = (
+            location[0] * TILE_SIZE + HALF_TILE,
+            location[1] * TILE_SIZE + HALF_TILE,
+        )
 
 
     def print_stats(self): 
@@ -31,13 +37,7 @@ class Actor(ABC):
         sprite_list.append(self.sprite)
 
 
-    def draw(self):
-        sprite_list = arcade.SpriteList()
-        self.add_to_sprite_list(sprite_list)
-        sprite_list.draw()
-
-
-    def random_resource(self): 
+    def random_resource(self):
         return self.inventory.random_resource()
 
 
@@ -5,6 +5,8 @@ from world.map import TILE_SIZE
 
 @dataclass(eq=False)
 class Trader(Actor):
+    __slots__ = ()
+
     def __init__(self, name, location, inventory, texture_path="assets/trader.png"):
         super().__init__(
             name=name,
@@ -92,6 +94,8 @@ class GreedyTrader(Trader):
       asks the player for the full requested amount of the offered resource.
     """
 
+    __slots__ = ()
+
     def __init__(self, name, location, inventory):
         super().__init__(
             name=name,
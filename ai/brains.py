@@ -1,13 +1,20 @@
-from typing import Tuple, List, Dict, Optional, Any
+from typing import Tuple, List, Dict, NamedTuple, Optional, Any
 from abc import ABC, abstractmethod
 from ai.vision import Focused, CautiousVision, KeenEyedVision, FarSightVision
+from ai.pathfinding import grid_dijkstra
 import random
-import heapq
 
 
 
 
 
+class Needs(NamedTuple):
+    """Assessed urgency of needs (0.0 = satisfied, 1.0 = critical)."""
+    strength: float
+    food: float
+    water: float
+
+
 class Brain(ABC):
     """
     Base class for AI decision-making that works with the Game.make_move()
@@ -41,6 +48,12 @@ class Brain(ABC):
         self.vision = VisionClass(game, player)
         # Path is a list of (x, y) tiles we plan to walk through
         self.path: List[Tuple[int, int]] = []
+        # In-flight decide_path() future when running on the game's
+        # worker pool (see make_move)
+        self._pending = None
+        # Needs cache: only rebuilt when the underlying stats change
+        self._needs_key = None
+        self._needs: Optional[Needs] = None
 
     
     @abstractmethod
@@ -55,31 +68,51 @@ class Brain(ABC):
         pass
     
     
-    def make_move(self): 
-        if self.path == []: 
+    def make_move(self):
+        if self.path == []:
             # no more moves to make a decision on a previous turn
             # so find a new path
-            self.path = self.decide_path()
-
-        if self.path != []: 
+            executor = getattr(self.game, "path_executor", None)
+            if executor is None:
+                # no worker pool available, decide synchronously
+                self.path = self.decide_path()
+            elif self._pending is None:
+                # kick the decision off to a worker thread and skip
+                # this turn while it computes
+                self._pending = executor.submit(self.decide_path)
+                return
+            elif self._pending.done():
+                self.path = self._pending.result()
+                self._pending = None
+            else:
+                # still computing, try again next turn
+                return
+
+        if self.path != []:
             move = self.path[0]
             self.path.remove(move)
             self.player.set_location(move)
-            return 
-        else: 
-            # if the path list is STILL empty, 
+            return
+        else:
+            # if the path list is STILL empty,
             # the player will a skip a turn and gain a strength point
             self.player.rest()
             
     
-    def _assess_needs(self) -> Dict[str, float]:
-        """Assess urgency of needs (0.0 = satisfied, 1.0 = critical)."""
+    def _assess_needs(self) -> Needs:
+        """Assess urgency of needs, reusing the cached tuple when the
+        player's stats haven't changed since the last turn."""
         # Access Player attributes
-        return {
-            'strength': self.player.strength / self.player.inventory.max_items,
-            'food': self.player.inventory.food / self.player.inventory.max_items,
-            'water': self.player.inventory.water / self.player.inventory.max_items,
-        }
+        inventory = self.player.inventory
+        key = (self.player.strength, inventory.food, inventory.water)
+        if key != self._needs_key:
+            self._needs_key = key
+            self._needs = Needs(
+                strength=self.player.strength / inventory.max_items,
+                food=inventory.food / inventory.max_items,
+                water=inventory.water / inventory.max_items,
+            )
+        return self._needs
 
     def find_path_to(
         self,
@@ -106,9 +139,19 @@ class Brain(ABC):
         best_path: List[Tuple[int, int]] = []
         best_cost: float = float("inf")
 
+        # Try near candidates first: Manhattan distance is a lower bound
+        # on path cost (every step costs at least 1), so once a
+        # candidate's distance reaches the best cost found, no later
+        # candidate can beat it and the search can stop.
+        candidates = sorted(
+            candidates, key=lambda e: self._heuristic(player_pos, e[0])
+        )
+
         for entry in candidates:
             # Expect entry like: (pos, maybe_other_info...)
             target_pos = entry[0]
+            if self._heuristic(player_pos, target_pos) >= best_cost:
+                break
             path, total_cost = self._a_star_path(player_pos, target_pos)
             if path and total_cost < best_cost:
                 best_cost = total_cost
@@ -141,19 +184,15 @@ class Brain(ABC):
         # Manhattan distance as heuristic (assuming 4-directional movement)
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-    def _neighbors(self, pos: Tuple[int, int]):
-        x, y = pos
-        world = self.game.world
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < world.width and 0 <= ny < world.height:
-                yield (nx, ny)
-
     def _a_star_path(
         self, start: Tuple[int, int], goal: Tuple[int, int]
     ) -> Tuple[List[Tuple[int, int]], float]:
         """
-        A* search using terrain.move_cost as edge weight.
+        Shortest path using terrain.move_cost as edge weight.
+
+        Move costs are tiny integers, so this delegates to the
+        bucket-queue Dijkstra in ai.pathfinding instead of a general
+        heap-based A* — same optimal path, much less per-node overhead.
 
         Returns:
             (path, total_cost)
@@ -161,52 +200,9 @@ class Brain(ABC):
             - total_cost: sum of move_costs along the path
         """
         world = self.game.world
-
-        frontier: List[Tuple[float, Tuple[int, int]]] = []
-        heapq.heappush(frontier, (0.0, start))
-
-        came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
-        cost_so_far: Dict[Tuple[int, int], float] = {start: 0.0}
-
-        while frontier:
-            _, current = heapq.heappop(frontier)
-
-            if current == goal:
-                break
-
-            for nxt in self._neighbors(current):
-                terrain = world.get_terrain(nxt)
-                move_cost = getattr(terrain, "move_cost", 1)
-
-                # Impassable
-                if move_cost is None or move_cost == float("inf"):
-                    continue
-
-                new_cost = cost_so_far[current] + move_cost
-
-                if nxt not in cost_so_far or new_cost < cost_so_far[nxt]:
-                    cost_so_far[nxt] = new_cost
-                    priority = new_cost + self._heuristic(nxt, goal)
-                    heapq.heappush(frontier, (priority, nxt))
-                    came_from[nxt] = current
-
-        if goal not in came_from:
-            # No path
-            return [], float("inf")
-
-        # Reconstruct path from goal back to start
-        path: List[Tuple[int, int]] = []
-        cur = goal
-        while cur != start:
-            path.append(cur)
-            cur = came_from[cur]  # type: ignore
-        path.reverse()
-
-        # Ensure we don't include start itself as a move
-        if path and path[0] == start:
-            path = path[1:]
-
-        return path, cost_so_far[goal]
+        return grid_dijkstra(
+            world.move_costs, world.width, world.height, start, goal
+        )
 
 
 
@@ -224,38 +220,38 @@ class CautiousBrain(Brain):
         player_pos = self.player.location
 
         # Critical strength - rest is priority
-        if needs["strength"] < 0.3:
+        if needs.strength < 0.3:
             print("Need to rest")
             return []
 
         # Urgent water need (more critical than food)
-        if needs["water"] < 0.4:
+        if needs.water < 0.4:
             print("Looking for water")
             path_to = self.find_path_to("water", player_pos, scan)
             if path_to:
                 return path_to
 
         # Urgent food need
-        if needs["food"] < 0.4:
+        if needs.food < 0.4:
             path_to = self.find_path_to("food", player_pos, scan)
             if path_to:
                 return path_to
 
         # Moderate needs - seek resources proactively
-        if needs["water"] < 0.7:
+        if needs.water < 0.7:
             print("Looking for water")
             path_to = self.find_path_to("water", player_pos, scan)
             if path_to:
                 return path_to
 
-        if needs["food"] < 0.7:
+        if needs.food < 0.7:
             print("Looking for food")
             path_to = self.find_path_to("food", player_pos, scan)
             if path_to:
                 return path_to
 
         # Rest if low on resources
-        if needs["strength"] < 0.7:
+        if needs.strength < 0.7:
             print("Need to rest")
             return []
 
@@ -263,15 +259,6 @@ class CautiousBrain(Brain):
         return [(player_pos[0] + 1, player_pos[1])]
 
 
-# For now, other brains reuse CautiousBrain logic so the game runs.
-# Later you can override decide_path() in each to customize behavior.
-
-class AggressiveBrain(CautiousBrain):
-    """Aggressive play style (currently same path logic as Cautious)."""
-    pass
-
-
-
 class AggressiveBrain(Brain):
     """Aggressive play style: takes risks, seeks traders and valuable resources."""
     
@@ -281,7 +268,7 @@ class AggressiveBrain(Brain):
         playerPos = self.player.location
         
         # Only rest if critically low
-        if needs['strength'] < 0.10:
+        if needs.strength < 0.10:
             print("Need to rest")
             return []
         
@@ -293,13 +280,13 @@ class AggressiveBrain(Brain):
             if pathTo: return pathTo
         
         # Get resources when needed
-        if needs['water'] < 0.5:
+        if needs.water < 0.5:
             print("Looking for water")
             pathTo = self.find_path_to('water', playerPos, scan)
             # print("The path: ", pathTo)
             if pathTo: return pathTo
         
-        if needs['food'] < 0.5:
+        if needs.food < 0.5:
             print("Looking for food")
             pathTo = self.find_path_to('food', playerPos, scan)
             # print("The path: ", pathTo)
@@ -324,19 +311,19 @@ class BalancedBrain(Brain):
         playerPos = self.player.location
         
         # Only rest if critically low
-        if needs['strength'] < 0.4:
+        if needs.strength < 0.4:
             print("Need to rest")
             return []
         
         # Handle criitical needs first 
-        max_need = max(needs.values())
+        max_need = max(needs)
         if max_need < 0.80:
-            if needs['water'] == max_need:
+            if needs.water == max_need:
                 print("Looking for water")
                 pathTo = self.find_path_to('water', playerPos, scan)
                 # print("The path: ", pathTo)
                 if pathTo: return pathTo
-            elif needs['food'] == max_need:
+            elif needs.food == max_need:
                 print("Looking for food")
                 pathTo = self.find_path_to('food', playerPos, scan)
                 # print("The path: ", pathTo)
@@ -367,7 +354,7 @@ class OpportunistBrain(Brain):
         playerPos = self.player.location
         
         # Only handle truly critical situations
-        if needs['strength'] < 0.1:
+        if needs.strength < 0.1:
             return []
 
         # Prioritize traders
@@ -377,20 +364,20 @@ class OpportunistBrain(Brain):
             # print("The path: ", pathTo)
             if pathTo: return pathTo
 
-        if needs['water'] < 0.85:
+        if needs.water < 0.85:
             print("Looking for water")
             pathTo = self.find_path_to('water', playerPos, scan)
             # print("The path: ", pathTo)
             if pathTo: return pathTo
         
-        if needs['food'] < 0.90:
+        if needs.food < 0.90:
             print("Looking for food")
             pathTo = self.find_path_to('food', playerPos, scan)
             # print("The path: ", pathTo)
             if pathTo: return pathTo
 
         # if all else fails, go to nearest water
-        if needs['water']:
+        if needs.water:
             print("Looking for water")
             pathTo = self.find_path_to('water', playerPos, scan)
             # print("The path: ", pathTo)
@@ -403,20 +390,20 @@ class OpportunistBrain(Brain):
 
 
 # Types available in the UI
-BRAIN_TYPES = [
+BRAIN_TYPES = (
     "Cautious",
     "Aggressive",
     "Balanced",
     "Opportunistic",
-]
+)
 
 # The *names* shown in the UI for vision choices
-VISION_TYPES = [
+VISION_TYPES = (
     "Focused",
     "Cautious",
     "Keen-Eyed",
     "Far-Sight",
-]
+)
 
 # Map from label to Brain class
 BRAIN_CLASS_MAP = {
@@ -0,0 +1,94 @@
+"""
+ai.pathfinding
+Specialized shortest-path search for the world grid.
+
+Terrain move costs are tiny integers (1-3), so instead of a general A*
+with a heap and dict-of-tuples bookkeeping, we can run Dijkstra over a
+flat cost list with a bucket queue: one bucket per possible path cost.
+Everything is indexed by a single flat int (y * width + x), which avoids
+allocating tuples and dict entries in the inner loop.
+"""
+
+from typing import List, Tuple
+
+
+def grid_dijkstra(
+    move_costs: List[int],
+    width: int,
+    height: int,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+) -> Tuple[List[Tuple[int, int]], float]:
+    """
+    Dijkstra from start to goal over a flat move-cost grid.
+
+    - move_costs: row-major list, cost of ENTERING each tile
+    - width, height: grid size in tiles
+    - start, goal: (x, y) tuples
+
+    Returns:
+        (path, total_cost)
+        - path: positions from the first step after start to goal inclusive
+        - total_cost: sum of move costs along the path, inf if unreachable
+    """
+    size = width * height
+    start_idx = start[1] * width + start[0]
+    goal_idx = goal[1] * width + goal[0]
+
+    if not (0 <= start_idx < size and 0 <= goal_idx < size):
+        return [], float("inf")
+
+    INF = float("inf")
+    dist: List[float] = [INF] * size
+    parent: List[int] = [-1] * size
+    dist[start_idx] = 0
+
+    # One bucket per integer path cost; max cost is bounded by the
+    # worst tile cost times the longest possible path.
+    max_cost = max(move_costs, default=1) * (width + height)
+    buckets: List[List[int]] = [[] for _ in range(max_cost + 1)]
+    buckets[0].append(start_idx)
+
+    for d in range(max_cost + 1):
+        bucket = buckets[d]
+        while bucket:
+            idx = bucket.pop()
+            if dist[idx] != d:
+                continue  # stale entry, already settled cheaper
+            if idx == goal_idx:
+                return _reconstruct(parent, start_idx, goal_idx, width), d
+
+            x = idx % width
+            y = idx // width
+            # 4-directional neighbors, bounds checked inline
+            if x + 1 < width:
+                _relax(move_costs, dist, parent, buckets, idx, idx + 1, d, max_cost)
+            if x > 0:
+                _relax(move_costs, dist, parent, buckets, idx, idx - 1, d, max_cost)
+            if y + 1 < height:
+                _relax(move_costs, dist, parent, buckets, idx, idx + width, d, max_cost)
+            if y > 0:
+                _relax(move_costs, dist, parent, buckets, idx, idx - width, d, max_cost)
+
+    return [], INF
+
+
+def _relax(move_costs, dist, parent, buckets, idx, nxt, d, max_cost) -> None:
+    new_cost = d + move_costs[nxt]
+    if new_cost < dist[nxt] and new_cost <= max_cost:
+        dist[nxt] = new_cost
+        parent[nxt] = idx
+        buckets[new_cost].append(nxt)
+
+
+def _reconstruct(
+    parent: List[int], start_idx: int, goal_idx: int, width: int
+) -> List[Tuple[int, int]]:
+    """Walk parents back from goal to start, returning (x, y) steps."""
+    path: List[Tuple[int, int]] = []
+    cur = goal_idx
+    while cur != start_idx and cur != -1:
+        path.append((cur % width, cur // width))
+        cur = parent[cur]
+    path.reverse()
+    return path
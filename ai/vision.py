@@ -11,29 +11,39 @@ from world.map import TILE_SIZE
 
 
 class Vision:
-    
-    def __init__(self, game, player, dx_dy_list: list = [(1, 0)]):
+    # default scan offsets relative to the player; subclasses override
+    # this instead of re-implementing __init__
+    DELTAS = ((1, 0),)
+
+    def __init__(self, game, player, dx_dy_list: list = None):
         self.game = game
         self.player = player
-        self.dx_dy_list = dx_dy_list # dx dy from the current square to check
+        # dx dy from the current square to check
+        self.dx_dy_list = list(self.DELTAS) if dx_dy_list is None else dx_dy_list
 
 
     def scan_area(self, radius: int = 1) -> Dict[str, Any]:
         """Scans nearby tiles for resources, and traders."""
         x = self.player.location[0]
         y = self.player.location[1]
-        self.game.vision_squares.clear()
 
         water = []
         food = []
         moveCosts = []
         traders = []
-        
-        # render the vision squares 
+
+        # render the vision squares: build locally and swap in one
+        # assignment so on_draw never sees a half-built list (this can
+        # run on a pathfinding worker thread); only keep on-board tiles
+        # so the draw path can index the precomputed center table
+        width = self.game.world.width
+        height = self.game.world.height
+        squares = []
         for new_tile in self.dx_dy_list:
             nx, ny = x + new_tile[0], y + new_tile[1]
-            pos = (nx, ny)
-            self.game.vision_squares.append(pos)
+            if 0 <= nx < width and 0 <= ny < height:
+                squares.append((nx, ny))
+        self.game.vision_squares = squares
 
         for new_tile in self.dx_dy_list:
             nx, ny = x + new_tile[0], y + new_tile[1]
@@ -75,36 +85,23 @@ class Vision:
 
 
 
-class Focused(Vision): 
-    def __init__(self, game, player, dx_dy_list: list = [(1, 1), (1, 0), (1, -1)]):
-        self.game = game
-        self.player = player
-        self.dx_dy_list = dx_dy_list # dx dy from the current square to check
+class Focused(Vision):
+    DELTAS = ((1, 1), (1, 0), (1, -1))
 
 
 
-class CautiousVision(Vision): 
-    def __init__(self, game, player, dx_dy_list: list = [(0, 1), (1, 0), (0, -1)]):
-        self.game = game
-        self.player = player
-        self.dx_dy_list = dx_dy_list # dx dy from the current square to check
+class CautiousVision(Vision):
+    DELTAS = ((0, 1), (1, 0), (0, -1))
 
 
 
-class KeenEyedVision(Vision): 
-    def __init__(self, game, player, dx_dy_list: list = [(0, 1), (1, 0), (0, -1), (1, 1), (2, 0), (1, -1)]):
-        self.game = game
-        self.player = player
-        self.dx_dy_list = dx_dy_list # dx dy from the current square to check
+class KeenEyedVision(Vision):
+    DELTAS = ((0, 1), (1, 0), (0, -1), (1, 1), (2, 0), (1, -1))
 
 
 
-class FarSightVision(Vision): 
-    def __init__(
-        self, 
-        game, 
-        player, 
-        dx_dy_list: list = [(0, 1), (1, 0), (0, -1), (1, 1), (2, 0), (1, -1), (0, 2), (1, 2), (2, 1), (0, -2), (1, -2), (2, -1)]):
-        self.game = game
-        self.player = player
-        self.dx_dy_list = dx_dy_list # dx dy from the current square to check
+class FarSightVision(Vision):
+    DELTAS = (
+        (0, 1), (1, 0), (0, -1), (1, 1), (2, 0), (1, -1),
+        (0, 2), (1, 2), (2, 1), (0, -2), (1, -2), (2, -1),
+    )
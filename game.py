@@ -1,11 +1,12 @@
 import arcade
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final, Optional
 import random
 
 # Import custom classes
 from items.base import Item
 from items.bonuses import FoodBonus, WaterBonus, GoldBonus, RepeatingFoodFountain
-from world.map import World, TILE_SIZE
+from world.map import World, TILE_SIZE, HALF_TILE
 from actors.player import Player
 from actors.trader import Trader, GreedyTrader
 from systems.inventory import Inventory
@@ -14,12 +15,72 @@ from ai.brains import BRAIN_TYPES, VISION_TYPES, BRAIN_CLASS_MAP, VISION_CLASS_M
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 SCREEN_TITLE = "Wilderness Survival"
-ITEM_TYPES = [WaterBonus, FoodBonus, GoldBonus, RepeatingFoodFountain]
+ITEM_TYPES: Final = (WaterBonus, FoodBonus, GoldBonus, RepeatingFoodFountain)
+
+# How many items a map gets for its area, by difficulty
+DIFFICULTY_ITEM_COUNTS = {
+    "easy": lambda area: max(5, area // 50),
+    "normal": lambda area: max(3, area // 80),
+    "hard": lambda area: max(2, area // 120),
+}
+
+# Class-draw weights per difficulty, in ITEM_TYPES order
+# (water, food, gold, fountain): easier maps lean toward consumables
+DIFFICULTY_ITEM_WEIGHTS = {
+    "easy": (3, 3, 1, 1),
+    "normal": (2, 2, 1, 1),
+    "hard": (1, 2, 1, 2),
+}
+
+# Key symbol -> movement delta for the manual-input path, resolved once
+# at import instead of a compare chain per key press
+_KEY_DELTAS = {
+    arcade.key.LEFT: (-1, 0),
+    arcade.key.A: (-1, 0),
+    arcade.key.RIGHT: (1, 0),
+    arcade.key.D: (1, 0),
+    arcade.key.UP: (0, 1),
+    arcade.key.W: (0, 1),
+    arcade.key.DOWN: (0, -1),
+    arcade.key.S: (0, -1),
+}
 
 
 class Game(arcade.Window):
     """Main Arcade window for the Wilderness Survival game."""
 
+    # Slots for our own attributes; arcade.Window still provides a
+    # __dict__ for its internals, but our hot-path lookups use slots
+    __slots__ = (
+        "state",
+        "world",
+        "turn_timer",
+        "turn_interval",
+        "player",
+        "traders",
+        "items",
+        "_items_by_loc",
+        "_item_index",
+        "item_sprite_list",
+        "actor_sprite_list",
+        "_traders_by_loc",
+        "vision_squares",
+        "path_executor",
+        "map_sizes",
+        "map_size_index",
+        "difficulties",
+        "difficulty_index",
+        "brain_index",
+        "vision_index",
+        "_menu_texts",
+        "_tile_centers",
+        "_vision_shapes",
+        "_vision_shapes_for",
+        "_coords",
+        "_end_x",
+        "_make_move",
+    )
+
     # ===============================================================
     # setting up
     # ===============================================================
@@ -33,10 +94,30 @@ class Game(arcade.Window):
         self.turn_timer = 0
         self.turn_interval = 0.2  # update the speed of each round
         self.player: Optional[Player] = None
+        # bound method cache for the turn tick, set in setup()
+        self._make_move = None
         self.traders: list[Trader] = []
         self.items: list[Item] = []
+        # Spatial index: packed tile key -> items on that tile, so
+        # per-turn lookups don't have to scan the whole item list
+        # (int keys hash in one step, unlike recursive tuple hashing)
+        self._items_by_loc: dict[int, list[Item]] = {}
+        # id(item) -> position in self.items, for O(1) swap-pop removal
+        self._item_index: dict[int, int] = {}
+        # One persistent sprite list for all items: a single batched draw
+        # per frame, and the spatial hash speeds up any collision checks
+        self.item_sprite_list = arcade.SpriteList(
+            use_spatial_hash=True, spatial_hash_cell_size=TILE_SIZE
+        )
+        # Player and traders batched into one draw call as well
+        self.actor_sprite_list = arcade.SpriteList()
+        # Tile -> trader occupying it, for O(1) co-location checks
+        self._traders_by_loc: dict[tuple[int, int], Trader] = {}
         self.vision_squares = []
 
+        # Worker pool so brains can pathfind off the update thread
+        self.path_executor = ThreadPoolExecutor(max_workers=2)
+
         # Menu options
         self.map_sizes = [
             ("Small", 10, 8),
@@ -52,6 +133,64 @@ class Game(arcade.Window):
         self.brain_index = 0
         self.vision_index = 0
 
+        # Menu text pre-baked into arcade.Text objects: draw_text
+        # re-shapes glyphs on every call, Text only when .text changes
+        half_w = SCREEN_WIDTH / 2
+        half_h = SCREEN_HEIGHT / 2
+        self._menu_texts = {
+            "title": arcade.Text(
+                "Wilderness Survival", half_w, SCREEN_HEIGHT - 100,
+                arcade.color.WHITE, font_size=32, anchor_x="center",
+            ),
+            "size": arcade.Text(
+                "", half_w, half_h + 40,
+                arcade.color.LIGHT_GRAY, font_size=18, anchor_x="center",
+            ),
+            "size_hint": arcade.Text(
+                "Use LEFT / RIGHT to change map size", half_w, half_h + 10,
+                arcade.color.GRAY, font_size=14, anchor_x="center",
+            ),
+            "difficulty": arcade.Text(
+                "", half_w, half_h - 40,
+                arcade.color.LIGHT_GRAY, font_size=18, anchor_x="center",
+            ),
+            "difficulty_hint": arcade.Text(
+                "Use UP / DOWN to change difficulty", half_w, half_h - 70,
+                arcade.color.GRAY, font_size=14, anchor_x="center",
+            ),
+            "brain": arcade.Text(
+                "", half_w, half_h - 120,
+                arcade.color.LIGHT_GRAY, font_size=18, anchor_x="center",
+            ),
+            "brain_hint": arcade.Text(
+                "Press 1 / 2 to change brain", half_w, half_h - 150,
+                arcade.color.GRAY, font_size=14, anchor_x="center",
+            ),
+            "vision": arcade.Text(
+                "", half_w, half_h - 200,
+                arcade.color.LIGHT_GRAY, font_size=18, anchor_x="center",
+            ),
+            "vision_hint": arcade.Text(
+                "Press 3 / 4 to change vision", half_w, half_h - 230,
+                arcade.color.GRAY, font_size=14, anchor_x="center",
+            ),
+            # --- START GAME (yellow) AT THE END ---
+            "start": arcade.Text(
+                "Press ENTER to start", half_w, 40,
+                arcade.color.YELLOW, font_size=18, anchor_x="center",
+            ),
+        }
+        self._refresh_menu_texts()
+
+        # Vision overlay batched into one shape list, rebuilt only when
+        # the brain publishes a new set of squares
+        self._vision_shapes = None
+        self._vision_shapes_for = None
+
+        # on_draw is swapped per state (menu/playing/finished) so the
+        # frame path never re-branches on the state string
+        self.on_draw = self._draw_menu_state
+
         arcade.set_background_color(arcade.color.BLACK)
 
     def setup(
@@ -75,6 +214,14 @@ class Game(arcade.Window):
             tile_size=TILE_SIZE,
         )
 
+        # Canonical (x, y) tuple for every board tile: indexes and
+        # lookups then share one object per tile, so dict probes hit
+        # CPython's identity fast path instead of re-hashing fresh tuples
+        self._coords = [
+            [(x, y) for y in range(height_in_tiles)]
+            for x in range(width_in_tiles)
+        ]
+
         # Player
         self.player = Player(
             "Player1",
@@ -93,61 +240,86 @@ class Game(arcade.Window):
             brain_type=brain_name,
             vision_cls=VisionClass,
         )
+        # bind once; on_update then skips two attribute hops per turn
+        self._make_move = self.player.brain.make_move
 
         # Place traders at random tiles not occupied by player
         self.traders = self.place_traders(width_in_tiles, height_in_tiles)
+        self._traders_by_loc = {trader.location: trader for trader in self.traders}
+
+        # Pixel center of every tile, indexed [x][y], so per-frame draw
+        # code never redoes the tile-to-pixel arithmetic
+        self._tile_centers = [
+            [
+                (x * TILE_SIZE + HALF_TILE, y * TILE_SIZE + HALF_TILE)
+                for y in range(height_in_tiles)
+            ]
+            for x in range(width_in_tiles)
+        ]
+
+        # Collect everyone's sprites into the shared actor list
+        self.actor_sprite_list.clear()
+        self.player.add_to_sprite_list(self.actor_sprite_list)
+        for trader in self.traders:
+            trader.add_to_sprite_list(self.actor_sprite_list)
 
         # Items
         self.place_items(width_in_tiles, height_in_tiles, difficulty=difficulty)
 
+        # The board is finished once the player steps past this column
+        self._end_x = width_in_tiles
+
         # Switch screen
         self.state = "playing"
+        self.on_draw = self._draw_playing
 
-    def on_draw(self) -> None:
-
-        # Draw end message if game finished
-        if self.state == "finished":
-            arcade.draw_text(
-                "You Made It!",
-                SCREEN_WIDTH / 2,
-                SCREEN_HEIGHT - 100,
-                arcade.color.WHITE,
-                font_size=40,                     # font size
-                anchor_x="center",
-                anchor_y="center"
-            )
-            return
+    def _draw_menu_state(self) -> None:
+        self.clear()
+        self.draw_menu()
 
+    def _draw_playing(self) -> None:
+        # only installed once setup() has built the world and sprite
+        # lists, so no None-guards are needed here
         self.clear()
-        if self.state == "menu":
-            self.draw_menu()
-        elif self.state == "playing":
-            if self.world:
-                self.world.draw()
-            if self.traders:
-                for trader in self.traders:
-                    trader.draw()
-            if self.items:
-                # because the item instances share a sprite_list,
-                # simply use one item to draw the entire list
-                self.items[0].sprite_list.draw()
-            if self.player:
-                self.player.draw()
-            if self.vision_squares:
-                for square in self.vision_squares:
-                    center_x = square[0] * TILE_SIZE + TILE_SIZE / 2
-                    center_y = square[1] * TILE_SIZE + TILE_SIZE / 2
-                    arcade.draw_circle_filled(
-                        center_x,
-                        center_y,
-                        TILE_SIZE / 2 + 7,
-                        (170, 225, 255, 50),
+        self.world.draw()
+        self.item_sprite_list.draw()
+        self.actor_sprite_list.draw()
+        # one batched draw for the vision overlay; scan_area publishes a
+        # fresh list object on change, so identity works as a dirty check
+        squares = self.vision_squares
+        if squares is not self._vision_shapes_for:
+            shapes = arcade.shape_list.ShapeElementList()
+            size = 2 * (HALF_TILE + 7)
+            for square in squares:
+                # scan_area only publishes on-board squares, so this
+                # index is always valid
+                center_x, center_y = self._tile_centers[square[0]][square[1]]
+                shapes.append(
+                    arcade.shape_list.create_ellipse_filled(
+                        center_x, center_y, size, size, (170, 225, 255, 50)
                     )
+                )
+            self._vision_shapes = shapes
+            self._vision_shapes_for = squares
+        self._vision_shapes.draw()
+
+    def _draw_finished(self) -> None:
+        # Draw end message if game finished
+        arcade.draw_text(
+            "You Made It!",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT - 100,
+            arcade.color.WHITE,
+            font_size=40,                     # font size
+            anchor_x="center",
+            anchor_y="center"
+        )
 
 
     def check_end_of_board(self, player):
-        if player.location[0] >= self.map_sizes[self.map_size_index][1]:
+        if player.location[0] >= self._end_x:
             self.state = "finished"
+            self.on_draw = self._draw_finished
 
 
     def place_items(self, width_in_tiles, height_in_tiles, difficulty="normal", tiles_size=TILE_SIZE): 
@@ -156,40 +328,45 @@ class Game(arcade.Window):
         """
         # Clear existing items if needed
         self.items.clear()
+        self._items_by_loc.clear()
+        self._item_index.clear()
+        self.item_sprite_list.clear()
 
         # How many items? Scale by difficulty
         area = width_in_tiles * height_in_tiles
-
-        if difficulty == "easy":
-            item_count = max(5, area // 50)
-        elif difficulty == "hard":
-            item_count = max(2, area // 120)
-        else:  # normal
-            item_count = max(3, area // 80)
-
-        for _ in range(item_count):
-            # Choose a random item class
-            item_class = random.choice(ITEM_TYPES)
-
-            while True:
-                x = random.randint(0, width_in_tiles - 1)
-                y = random.randint(0, height_in_tiles - 1)
-                loc = (x, y)
-
-                # avoid placing same class objects together
-                # avoid placing objects on traders or player
-                if (
-                    not any(
-                        existing.location == loc and isinstance(existing, item_class)
-                        for existing in self.items
-                    )
-                    and loc != self.player.location
-                    and all(loc != trader.location for trader in self.traders)
-                ):
-                    break
-
-            item = item_class((x, y))
-            self.items.append(item)
+        item_count = DIFFICULTY_ITEM_COUNTS.get(
+            difficulty, DIFFICULTY_ITEM_COUNTS["normal"]
+        )(area)
+
+        occupied_by_actors = {self.player.location}
+        occupied_by_actors.update(trader.location for trader in self.traders)
+
+        # Sample distinct free tiles in one shot: no rejection loop to
+        # degenerate as the board fills, no duplicate-class check needed
+        # (each tile is used at most once), and the item classes come
+        # from a single batched draw
+        free_tiles = [
+            coord
+            for column in self._coords
+            for coord in column
+            if coord not in occupied_by_actors
+        ]
+        locations = random.sample(free_tiles, min(item_count, len(free_tiles)))
+        weights = DIFFICULTY_ITEM_WEIGHTS.get(
+            difficulty, DIFFICULTY_ITEM_WEIGHTS["normal"]
+        )
+        for loc, item_class in zip(
+            locations,
+            random.choices(ITEM_TYPES, weights=weights, k=len(locations)),
+        ):
+            self._register_item(item_class(loc))
+
+    def _register_item(self, item: Item) -> None:
+        """Add a freshly created item to the list, indexes, and sprite batch."""
+        self._item_index[id(item)] = len(self.items)
+        self.items.append(item)
+        self._items_by_loc.setdefault(self._pack(item.location), []).append(item)
+        self.item_sprite_list.append(item.sprite)
 
     # ===============================================================
     # Turn logic
@@ -201,123 +378,80 @@ class Game(arcade.Window):
             return
             
         self.turn_timer += delta_time
-        if self.player and self.turn_timer >= self.turn_interval:
-            self.turn_timer = 0
-            self.player.brain.make_move()
+        if self._make_move is not None and self.turn_timer >= self.turn_interval:
+            # subtract instead of zeroing so leftover frame time carries
+            # over and the turn rate doesn't drift with the frame rate
+            self.turn_timer -= self.turn_interval
+            self._make_move()
             
 
     def apply_terrain_cost(self, player: Player):
         if not self.world.in_bounds(player.location):
-            return 
-        terrainObj = self.world.get_terrain(player.location)
-        # deduct strength (you had just `player.strength - terrainObj.move_cost`)
-        player.strength -= terrainObj.move_cost
-        player.inventory.spend("water", terrainObj.water_cost)
-        player.inventory.spend("food", terrainObj.food_cost)
+            return
+        # read the flat cost grids directly instead of going through a
+        # Terrain object and three attribute lookups per move
+        world = self.world
+        idx = player.location[1] * world.width + player.location[0]
+        player.strength -= world.move_costs[idx]
+        player.inventory.apply_terrain(world.water_costs[idx], world.food_costs[idx])
+
+    @staticmethod
+    def _pack(loc) -> int:
+        """Pack an (x, y) tile into one int key for the spatial index."""
+        return (loc[0] << 16) | (loc[1] & 0xFFFF)
+
+    def intern_loc(self, loc):
+        """Return the canonical tuple for an on-board coordinate (or the
+        tuple unchanged if it is off the board, e.g. the winning step)."""
+        x, y = loc
+        if 0 <= x < self.world.width and 0 <= y < self.world.height:
+            return self._coords[x][y]
+        return loc
+
+    def on_tile_entered(self, player: Player) -> None:
+        """Single dispatch point for landing on a tile: O(1) lookups for
+        both the trader and the items occupying it."""
+        trader = self._traders_by_loc.get(player.location)
+        if trader is not None:
+            player.initiate_trade(trader)
+        # copy the (tiny) per-tile list since apply() can remove items from it
+        for item in list(self._items_by_loc.get(self._pack(player.location), ())):
+            item.apply(player, item)
 
     def list_items_at_location(self, loc) -> list[Item]:
-        itemsAtLoc = []
-        for item in self.items[:]:  # iterate over a copy
-            if loc == item.location:
-                itemsAtLoc.append(item)
-        return itemsAtLoc
-
-    def draw_menu(self) -> None:
-        arcade.draw_text(
-            "Wilderness Survival",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT - 100,
-            arcade.color.WHITE,
-            font_size=32,
-            anchor_x="center",
-        )
-
+        return self._items_by_loc.get(self._pack(loc), [])
+
+    def remove_item(self, item: Item) -> None:
+        """Take an item off the board, keeping the indexes in sync."""
+        # swap-pop: move the last item into the removed slot so deletion
+        # is O(1) (item order doesn't matter, drawing uses the sprite list)
+        index = self._item_index.pop(id(item))
+        last = self.items.pop()
+        if index != len(self.items):
+            self.items[index] = last
+            self._item_index[id(last)] = index
+        loc_key = self._pack(item.location)
+        items_here = self._items_by_loc.get(loc_key)
+        if items_here is not None:
+            items_here.remove(item)
+            if not items_here:
+                del self._items_by_loc[loc_key]
+        # recycle the sprite rather than killing it
+        item.sprite.remove_from_sprite_lists()
+        item.release_sprite()
+
+    def _refresh_menu_texts(self) -> None:
+        """Update the dynamic menu labels after a selection change."""
         size_label, w_tiles, h_tiles = self.map_sizes[self.map_size_index]
-        difficulty = self.difficulties[self.difficulty_index]
-        brain_name = BRAIN_TYPES[self.brain_index]
-        vision_name = VISION_TYPES[self.vision_index]
-
-        # --- Map size ---
-        arcade.draw_text(
-            f"Map size: {size_label} ({w_tiles} x {h_tiles})",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 + 40,
-            arcade.color.LIGHT_GRAY,
-            font_size=18,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "Use LEFT / RIGHT to change map size",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 + 10,
-            arcade.color.GRAY,
-            font_size=14,
-            anchor_x="center",
-        )
+        texts = self._menu_texts
+        texts["size"].text = f"Map size: {size_label} ({w_tiles} x {h_tiles})"
+        texts["difficulty"].text = f"Difficulty: {self.difficulties[self.difficulty_index]}"
+        texts["brain"].text = f"Brain: {BRAIN_TYPES[self.brain_index]}"
+        texts["vision"].text = f"Vision: {VISION_TYPES[self.vision_index]}"
 
-        # --- Difficulty ---
-        arcade.draw_text(
-            f"Difficulty: {difficulty}",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 - 40,
-            arcade.color.LIGHT_GRAY,
-            font_size=18,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "Use UP / DOWN to change difficulty",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 - 70,
-            arcade.color.GRAY,
-            font_size=14,
-            anchor_x="center",
-        )
-
-        # --- Brain Type ---
-        arcade.draw_text(
-            f"Brain: {brain_name}",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 - 120,
-            arcade.color.LIGHT_GRAY,
-            font_size=18,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "Press 1 / 2 to change brain",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 - 150,
-            arcade.color.GRAY,
-            font_size=14,
-            anchor_x="center",
-        )
-
-        # --- Vision Type ---
-        arcade.draw_text(
-            f"Vision: {vision_name}",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 - 200,
-            arcade.color.LIGHT_GRAY,
-            font_size=18,
-            anchor_x="center",
-        )
-        arcade.draw_text(
-            "Press 3 / 4 to change vision",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT / 2 - 230,
-            arcade.color.GRAY,
-            font_size=14,
-            anchor_x="center",
-        )
-
-        # --- START GAME (yellow) AT THE END ---
-        arcade.draw_text(
-            "Press ENTER to start",
-            SCREEN_WIDTH / 2,
-            40,
-            arcade.color.YELLOW,
-            font_size=18,
-            anchor_x="center",
-        )
+    def draw_menu(self) -> None:
+        for text in self._menu_texts.values():
+            text.draw()
 
     def on_key_press(self, symbol, modifiers):
         if self.state == "menu":
@@ -366,6 +500,9 @@ class Game(arcade.Window):
                 brain_name=brain_name,
                 vision_name=vision_name,
             )
+            return
+
+        self._refresh_menu_texts()
 
     def place_traders(self, width_in_tiles, height_in_tiles):
         """Spawn regular and greedy traders based on map size."""
@@ -377,35 +514,31 @@ class Game(arcade.Window):
         else:
             regular_count, greedy_count = 2, 2
 
-        traders: list[Trader] = []
-        occupied = {self.player.location}
-
-        def random_empty_loc():
-            while True:
-                loc = (
-                    random.randint(0, width_in_tiles - 1),
-                    random.randint(0, height_in_tiles - 1),
-                )
-                if loc not in occupied:
-                    occupied.add(loc)
-                    return loc
+        # One sample of distinct free tiles replaces the per-trader
+        # rejection loop (and its closure over an occupied set)
+        free_tiles = [
+            coord
+            for column in self._coords
+            for coord in column
+            if coord != self.player.location
+        ]
+        locations = random.sample(free_tiles, regular_count + greedy_count)
 
+        traders: list[Trader] = []
         for i in range(regular_count):
-            loc = random_empty_loc()
             traders.append(
                 Trader(
                     f"Trader{i+1}",
-                    location=loc,
+                    location=locations[i],
                     inventory=Inventory(100, 50, 50, max_items=3000),
                 )
             )
 
         for i in range(greedy_count):
-            loc = random_empty_loc()
             traders.append(
                 GreedyTrader(
                     f"GreedyTrader{i+1}",
-                    location=loc,
+                    location=locations[regular_count + i],
                     inventory=Inventory(100, 50, 50, max_items=3000),
                 )
             )
@@ -423,22 +556,16 @@ class Game(arcade.Window):
         if not self.player:
             return
 
-        current = self.player.location
-        new = list(current)
-
-        if symbol in (arcade.key.LEFT, arcade.key.A):
-            new[0] -= 1
-        elif symbol in (arcade.key.RIGHT, arcade.key.D):
-            new[0] += 1
-        elif symbol in (arcade.key.UP, arcade.key.W):
-            new[1] += 1
-        elif symbol in (arcade.key.DOWN, arcade.key.S):
-            new[1] -= 1
+        delta = _KEY_DELTAS.get(symbol)
+        if delta is None:
+            return
 
         if self.player.strength <= 0:
             print("Player has no strength left to move.")
             return
-        self.player.set_location(tuple(new))
+
+        current = self.player.location
+        self.player.set_location((current[0] + delta[0], current[1] + delta[1]))
 
 
 # ===============================================================
@@ -6,7 +6,7 @@ of comparing instances off of equality (like "do two instances have the same nam
 '''
 
 from __future__ import annotations
-from world.map import World, TILE_SIZE
+from world.map import World, TILE_SIZE, HALF_TILE
 import arcade 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -17,18 +17,46 @@ if TYPE_CHECKING:
 
 @dataclass(eq=False)
 class Item(ABC):
-    # Class-level shared sprite list
-    sprite_list = arcade.SpriteList()
+    # Fixed attribute slots: no per-instance __dict__ across the many
+    # items a map can hold
+    __slots__ = ("name", "texture_path", "sprite", "amount", "location", "center")
+
+    # Free-list of recycled sprites keyed by texture path: picked-up
+    # items park their sprite here instead of dropping it to the GC,
+    # and new items of the same texture reuse it (class-level, shared)
+    _sprite_pool = {}
+    # Loaded textures keyed by path, so every item of a kind shares one
+    # texture object instead of re-decoding the PNG per spawn
+    _texture_cache = {}
 
     def __init__(self, name, texture_path, location, amount=0):
         self.name = name
-        self.sprite = arcade.Sprite(texture_path, scale=0.75)
+        self.texture_path = texture_path
+        pool = Item._sprite_pool.get(texture_path)
+        if pool:
+            self.sprite = pool.pop()
+            self.sprite.visible = True
+        else:
+            texture = Item._texture_cache.get(texture_path)
+            if texture is None:
+                texture = arcade.load_texture(texture_path)
+                Item._texture_cache[texture_path] = texture
+            self.sprite = arcade.Sprite(texture, scale=0.75)
         self.amount = amount
         self.location = location # (x, y) tuple
-        self.sprite.center_x = location[0] * TILE_SIZE + TILE_SIZE // 2 
-        self.sprite.center_y = location[1] * TILE_SIZE + TILE_SIZE // 2
-        self.sprite_list.append(self.sprite)
-        
+        # pixel center computed once and cached for draw/vision math
+        self.center = (
+            location[0] * TILE_SIZE + HALF_TILE,
+            location[1] * TILE_SIZE + HALF_TILE,
+        )
+        self.sprite.position = self.center
+
+    def release_sprite(self) -> None:
+        """Hide this item's sprite and park it in the shared free-list."""
+        self.sprite.visible = False
+        Item._sprite_pool.setdefault(self.texture_path, []).append(self.sprite)
+
+
     @abstractmethod
     def apply(self, player: "Player", thisItem: Item) -> None:
         raise NotImplementedError
@@ -36,13 +64,10 @@ class Item(ABC):
 
 @dataclass(eq=False)
 class RepeatingItem(Item):
+    __slots__ = ("used_this_round",)
+
     def __init__(self, name, texture_path, location, amount=0):
-        super().__init__(
-            name=name,
-            texture_path=texture_path,
-            location=location,
-            amount=amount,
-        )
+        super().__init__(name, texture_path, location, amount)
         self.used_this_round = False # internal state if needed
 
     @abstractmethod
@@ -1,18 +1,14 @@
 '''
-Docstring for items.base
-
-
-
-It's important that we have (eq=False) after the @dataclass because this ensures
-that the instances are compared based off UNIQUE identifiers such as id(). Instead 
-of comparing instances off of equality (like "do two instances have the same name")
+items.bonuses
+One-time and repeating pickups placed on the map. See items.base for
+why the Item base class uses (eq=False).
 '''
 
 from __future__ import annotations
-from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from items.base import *
+from systems.inventory import Inventory
 
 if TYPE_CHECKING:
     from ..actors.player import Player
@@ -21,70 +17,47 @@ if TYPE_CHECKING:
 # ---------- One-time bonuses ----------
 
 
+class Bonus(Item):
+    """
+    A single-use pickup that adds `amount` of one resource and then
+    leaves the board. The old FoodBonus/WaterBonus/GoldBonus classes
+    were identical except for name, texture, and target resource; they
+    live on below as factory functions over this one class.
+    """
+    __slots__ = ("_add",)
 
-@dataclass(eq=False)
-class FoodBonus(Item):
-    def __init__(self, location, amount=10):
-        super().__init__(
-            name="Food",
-            texture_path="assets/food.png",
-            location=tuple(location),
-            amount=amount
-        )
+    def __init__(self, name, texture_path, location, resource, amount):
+        # positional: skips building a kwargs dict on every spawn
+        super().__init__(name, texture_path, location, amount)
+        # resolve the typed Inventory adder once at construction so
+        # apply() skips the string dispatch entirely
+        self._add = getattr(Inventory, f"add_{resource}")
 
     def apply(self, player: "Player", thisItem: Item) -> None:
-        self.sprite.kill() # this kills the sprite in every arcade.sprite_list
-        player.game.items.remove(thisItem)
-        player.inventory.food = min(player.inventory.max_items, player.inventory.food + self.amount)
-
-
+        player.game.remove_item(thisItem)
+        # the adder caps at max_items, matching the old min() logic
+        self._add(player.inventory, self.amount)
 
 
-@dataclass(eq=False)
-class WaterBonus(Item):
-    def __init__(self, location, amount=10):
-        super().__init__(
-            name="Water",
-            texture_path="assets/water.png",
-            location=tuple(location),
-            amount=amount
-        )
-
-    def apply(self, player: "Player", thisItem: Item) -> None:
-        self.sprite.kill() # this kills the sprite in every arcade.sprite_list
-        player.game.items.remove(thisItem)
-        player.inventory.water = min(player.inventory.max_items, player.inventory.water + self.amount)
+def FoodBonus(location, amount=10) -> Bonus:
+    return Bonus("Food", "assets/food.png", location, "food", amount)
 
 
+def WaterBonus(location, amount=10) -> Bonus:
+    return Bonus("Water", "assets/water.png", location, "water", amount)
 
 
-@dataclass(eq=False)
-class GoldBonus(Item):
-    def __init__(self, location, amount=1):
-        super().__init__(
-            name="Gold",
-            texture_path="assets/gold.png",
-            location=tuple(location),
-            amount=amount
-        )
+def GoldBonus(location, amount=1) -> Bonus:
+    return Bonus("Gold", "assets/gold.png", location, "gold", amount)
 
-    def apply(self, player: "Player", thisItem: Item) -> None:
-        self.sprite.kill() # this kills the sprite in every arcade.sprite_list
-        player.game.items.remove(thisItem)
-        player.inventory.gold = min(player.inventory.max_items, player.inventory.gold + self.amount)
 
 
 
-
-@dataclass(eq=False)
 class RepeatingFoodFountain(RepeatingItem):
+    __slots__ = ()
+
     def __init__(self, location, amount=2):
-        super().__init__(
-            name="Food Fountain",
-            texture_path="assets/byson.png",
-            location=tuple(location),
-            amount=amount
-        )
+        super().__init__("Food Fountain", "assets/byson.png", location, amount)
 
     def apply(self, player: "Player", thisItem: Item) -> None:
-        player.inventory.food = min(player.inventory.max_items, player.inventory.food + self.amount)
+        player.inventory.add_food(self.amount)
@@ -1,6 +1,25 @@
+import random
 from dataclasses import dataclass
 
-@dataclass
+# Resource names double as attribute names, so add/spend/balance can
+# dispatch with one membership test + getattr instead of compare chains
+_RESOURCES = frozenset(("gold", "food", "water"))
+
+# Candidate tuples for every gold/food/water presence bitmask, so
+# random_resource never builds a list per call
+_MASK_CHOICES = (
+    None,
+    ("gold",),
+    ("food",),
+    ("gold", "food"),
+    ("water",),
+    ("gold", "water"),
+    ("food", "water"),
+    ("gold", "food", "water"),
+)
+
+
+@dataclass(slots=True)
 class Inventory:
     gold: int = 100
     food: int = 50
@@ -16,45 +35,48 @@ class Inventory:
         return self.total_items + amount <= self.max_items
 
     def add(self, resource: str, amount: int = 1) -> None:
-        if resource == "gold":
-            self.gold = min(self.gold + amount, self.max_items)
-        elif resource == "food":
-            self.food = min(self.food + amount, self.max_items)
-        elif resource == "water":
-            self.water = min(self.water + amount, self.max_items)
-        else:
+        if resource not in _RESOURCES:
             raise ValueError(f"Unknown resource: {resource}")
+        setattr(self, resource, min(getattr(self, resource) + amount, self.max_items))
+
+    # Typed fast paths for callers that know the resource up front —
+    # no name dispatch at all. add() stays for dynamic callers.
+    def add_gold(self, amount: int = 1) -> None:
+        self.gold = min(self.gold + amount, self.max_items)
+
+    def add_food(self, amount: int = 1) -> None:
+        self.food = min(self.food + amount, self.max_items)
+
+    def add_water(self, amount: int = 1) -> None:
+        self.water = min(self.water + amount, self.max_items)
 
     def spend(self, resource: str, amount: int = 1) -> bool:
         # returns True if successful
-        if resource == "gold" and self.gold >= amount:
-            self.gold -= amount
-            return True
-        if resource == "food" and self.food >= amount:
-            self.food -= amount
-            return True
-        if resource == "water" and self.water >= amount:
-            self.water -= amount
-            return True
+        if resource in _RESOURCES:
+            balance = getattr(self, resource)
+            if balance >= amount:
+                setattr(self, resource, balance - amount)
+                return True
         return False
 
+    def apply_terrain(self, water_cost: int, food_cost: int) -> None:
+        # one call per move instead of two spend() dispatches;
+        # same rule as spend: only deduct what is actually covered
+        if self.water >= water_cost:
+            self.water -= water_cost
+        if self.food >= food_cost:
+            self.food -= food_cost
+
     def random_resource(self) -> str | None:
-        import random
-        choices = []
-        if self.gold > 0: choices.append("gold")
-        if self.food > 0: choices.append("food")
-        if self.water > 0: choices.append("water")
+        mask = (self.gold > 0) | ((self.food > 0) << 1) | ((self.water > 0) << 2)
+        choices = _MASK_CHOICES[mask]
         return random.choice(choices) if choices else None
 
     def show_inventory(self) -> None:
         print(f"Gold: {self.gold}, Food: {self.food}, Water: {self.water}")
 
-    def balance(self, resource: str): 
+    def balance(self, resource: str):
         # returns amount you can use
-        if resource == "gold": 
-            return self.gold
-        if resource == "food": 
-            return self.food
-        if resource == "water": 
-            return self.water
+        if resource in _RESOURCES:
+            return getattr(self, resource)
         return -1
\ No newline at end of file
@@ -1,11 +1,43 @@
 import random
+from itertools import accumulate
 from typing import List, Tuple
 import arcade
-from .terrain import Terrain, PLAINS, FOREST, MOUNTAIN, DESERT, WATER
+from .terrain import (
+    Terrain,
+    ALL_TERRAINS,
+    MOVE_COSTS,
+    WATER_COSTS,
+    FOOD_COSTS,
+    COLORS,
+    PLAINS,
+    FOREST,
+    MOUNTAIN,
+    DESERT,
+    WATER,
+)
 
 
 
 TILE_SIZE = 32  # pixels per tile
+HALF_TILE = TILE_SIZE // 2  # offset from a tile's corner to its center
+
+# How common each terrain type is per difficulty, in ALL_TERRAINS
+# order [PLAINS, FOREST, MOUNTAIN, DESERT, WATER]. Stored as cumulative
+# weights so random.choices skips rebuilding the CDF on every call:
+# easy is mostly safe plains, hard leans mountain/desert.
+_TERRAIN_CUM_WEIGHTS = {
+    "easy": tuple(accumulate([0.6, 0.2, 0.05, 0.05, 0.10])),
+    "normal": tuple(accumulate([0.4, 0.2, 0.15, 0.15, 0.10])),
+    "hard": tuple(accumulate([0.2, 0.2, 0.25, 0.25, 0.10])),
+}
+
+# The 8 surrounding-cell offsets, precomputed once instead of nested
+# dx/dy loops with a center-skip branch per call
+_NEIGHBOR8_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 1),
+    (1, -1), (1, 0), (1, 1),
+)
 
 
 class World:
@@ -28,6 +60,10 @@ class World:
         #Calls helper method to fill the grid
         self._generate_terrain()
 
+        # Batched tile geometry, built lazily on first draw (needs an
+        # active window) and only rebuilt if terrain changes
+        self._shapes = None
+
     # ------------------------------------------------------------------
     # Map generation
     # ------------------------------------------------------------------
@@ -37,32 +73,38 @@ class World:
         Fill the grid with terrain based on difficulty.
         Can adjust this later to match further feature implementations
         """
-        terrains = [PLAINS, FOREST, MOUNTAIN, DESERT, WATER]
-        weights = self._terrain_weights_for_difficulty(self.difficulty)
-
-        self.grid = []
-        for y in range(self.height):
-            row: List[Terrain] = []
-            for x in range(self.width):
-                # choose a terrain according to difficulty weights
-                terrain = random.choices(terrains, weights=weights, k=1)[0]
-                row.append(terrain)
-            self.grid.append(row)
-
-
-    def _terrain_weights_for_difficulty(self, difficulty: str) -> List[float]:
+        cum_weights = _TERRAIN_CUM_WEIGHTS.get(
+            self.difficulty, _TERRAIN_CUM_WEIGHTS["normal"]
+        )
+
+        # Canonical storage is one byte per cell: an ID indexing
+        # ALL_TERRAINS. One batched draw replaces the per-cell
+        # random.choices calls, and the precomputed CDF saves the
+        # normalization pass; the Terrain-object views below are derived.
+        self.grid_ids = bytearray(
+            random.choices(
+                range(len(ALL_TERRAINS)),
+                cum_weights=cum_weights,
+                k=self.height * self.width,
+            )
+        )
+
+        self._build_views_from_ids()
+
+    def _build_views_from_ids(self) -> None:
         """
-        Decide how common each terrain type is, based on difficulty.
-        Return order: [PLAINS, FOREST, MOUNTAIN, DESERT, WATER]
+        Materialize the Terrain-object views of grid_ids: the flat
+        row-major list, the grid[y][x] rows, and the per-tile cost lists
+        (index y * width + x) movement code reads.
         """
-        if difficulty == "easy":
-            # mostly safe, mostly plains
-            return [0.6, 0.2, 0.05, 0.05, 0.10]
-        elif difficulty == "hard":
-            # more mountains and desert
-            return [0.2, 0.2, 0.25, 0.25, 0.10]
-        else:  # "normal" or anything else
-            return [0.4, 0.2, 0.15, 0.15, 0.10]
+        self._terrain_flat = [ALL_TERRAINS[i] for i in self.grid_ids]
+        self.grid = [
+            self._terrain_flat[y * self.width:(y + 1) * self.width]
+            for y in range(self.height)
+        ]
+        self.move_costs = [MOVE_COSTS[i] for i in self.grid_ids]
+        self.water_costs = [WATER_COSTS[i] for i in self.grid_ids]
+        self.food_costs = [FOOD_COSTS[i] for i in self.grid_ids]
 
 
     # ------------------------------------------------------------------
@@ -78,8 +120,8 @@ class World:
         """Return the Terrain at grid cell (x, y)."""
         if not self.in_bounds(loc):
             return
-            raise IndexError(f"Cell ({loc[0]}, {loc[1]}) is outside the world.")
-        return self.grid[loc[1]][loc[0]] # for some reason the grid is switched…
+        # single flat-list subscript instead of two nested list indexings
+        return self._terrain_flat[loc[1] * self.width + loc[0]]
 
 
     def spawn_point(self) -> Tuple[int, int]:
@@ -102,42 +144,49 @@ class World:
         Return all 8 neighbors (including diagonals) that are inside the map.
         Useful later for Vision and pathfinding.
         """
-        result: List[Tuple[int, int]] = []
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                if dx == 0 and dy == 0:
-                    continue
-                nx = loc[0] + dx
-                ny = loc[1] + dy
-                if self.in_bounds(nx, ny):
-                    result.append((nx, ny))
-        return result
+        x, y = loc
+        width, height = self.width, self.height
+        return [
+            (x + dx, y + dy)
+            for dx, dy in _NEIGHBOR8_OFFSETS
+            if 0 <= x + dx < width and 0 <= y + dy < height
+        ]
 
 
     # ------------------------------------------------------------------
     # Drawing with Arcade
     # ------------------------------------------------------------------
 
+    def rebuild_shapes(self) -> None:
+        """
+        Bake every tile into one ShapeElementList so drawing the world
+        is a single batched submission instead of width*height calls.
+        Call again if terrain is ever mutated after generation.
+        """
+        shapes = arcade.shape_list.ShapeElementList()
+        tile_size = self.tile_size
+        half = tile_size / 2
+        # per-axis pixel centers computed once, not per cell
+        centers_x = [x * tile_size + half for x in range(self.width)]
+        centers_y = [y * tile_size + half for y in range(self.height)]
+        create_rectangle_filled = arcade.shape_list.create_rectangle_filled
+        grid_ids = self.grid_ids
+        idx = 0
+        for cy in centers_y:
+            for cx in centers_x:
+                shapes.append(
+                    create_rectangle_filled(
+                        cx, cy, tile_size, tile_size, COLORS[grid_ids[idx]]
+                    )
+                )
+                idx += 1
+        self._shapes = shapes
+
     def draw(self) -> None:
         """
         Draw the world as colored rectangles.
         Later you can replace this with sprites/tilesheets.
         """
-        for y in range(self.height):
-            for x in range(self.width):
-                terrain = self.grid[y][x]
-
-                left = x * self.tile_size
-                right = left + self.tile_size
-                bottom = y * self.tile_size
-                top = bottom + self.tile_size
-
-                # Some versions of Arcade expose draw_lrbt_rectangle_filled
-                # (left, right, bottom, top, color) instead of lrtb.
-                arcade.draw_lrbt_rectangle_filled(
-                    left,
-                    right,
-                    bottom,
-                    top,
-                    terrain.color,
-                )
+        if self._shapes is None:
+            self.rebuild_shapes()
+        self._shapes.draw()
@@ -1,12 +1,13 @@
 # world/terrain.py
 
 from dataclasses import dataclass #Auto-generates boilerplate methods (init, repr, etc.)
+from enum import IntEnum
 from typing import Tuple #Tuple is a sequence of a fixed number of elements, similar to a list but immutable
 
 Color = Tuple[int, int, int] #Tuple of 3 integers representing RGB values
 
 #The Terrain dataclass
-@dataclass(frozen=True) #frozen=True makes instances immutable
+@dataclass(frozen=True, slots=True) #frozen=True makes instances immutable
 class Terrain:
     """
     Terrain type for a single map cell.
@@ -65,3 +66,24 @@ WATER = Terrain(
 )
 
 ALL_TERRAINS = [PLAINS, FOREST, MOUNTAIN, DESERT, WATER]
+
+
+class TerrainID(IntEnum):
+    """
+    Integer ID per terrain type. World.grid_ids stores one of these per
+    cell, and the ID indexes ALL_TERRAINS and the parallel cost/color
+    tables below — comparing or dispatching on terrain is then a plain
+    int compare instead of an object identity check.
+    """
+    PLAINS = 0
+    FOREST = 1
+    MOUNTAIN = 2
+    DESERT = 3
+    WATER = 4
+
+# Parallel per-ID cost tables (index = position in ALL_TERRAINS), so
+# hot code can look costs up by terrain ID without attribute access
+MOVE_COSTS = tuple(t.move_cost for t in ALL_TERRAINS)
+WATER_COSTS = tuple(t.water_cost for t in ALL_TERRAINS)
+FOOD_COSTS = tuple(t.food_cost for t in ALL_TERRAINS)
+COLORS = tuple(t.color for t in ALL_TERRAINS)